@@ -8,8 +8,6 @@ from sider.utils import time_it
 if sys.platform != "win32":
     import uvloop
 
-    uvloop.install()
-
 
 @asynccontextmanager
 async def get_sider():
@@ -72,15 +70,9 @@ async def main():
 
         await check_result()
 
-        with time_it("sider pipe ignore, str", iterations=iterations):
-            p = r.pipeline()
-            for k in str_keys:
-                p.command("SET", k, k)
-            res = await p.execute(ignore_results=True)
-
-        assert res is None
-        await check_and_flush()
-
+        # the ignore benchmark measures pure client overhead, so use the
+        # pre-encoded bytes path only; str encoding cost is already
+        # covered by the "sider pipe, str" run above
         with time_it("sider pipe ignore, bytes", iterations=iterations):
             p = r.pipeline()
             for k in bytes_keys:
@@ -91,4 +83,9 @@ async def main():
         await check_and_flush()
 
 
-asyncio.run(main())
+if sys.platform != "win32":
+    # uvloop.run uses uvloop's own runner without installing a global
+    # event loop policy
+    uvloop.run(main())
+else:
+    asyncio.run(main())
@@ -1,7 +1,11 @@
 import asyncio
+import sys
 
 from sider import RedisClient
 
+if sys.platform != "win32":
+    import uvloop
+
 
 async def main():
     client = await RedisClient().connect()
@@ -12,4 +16,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if sys.platform != "win32":
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -8,8 +8,6 @@ from contextlib import contextmanager
 if sys.platform != "win32":
     import uvloop
 
-    uvloop.install()
-
 
 @contextmanager
 def time_it(name: str, iterations: int):
@@ -85,4 +83,7 @@ async def main():
         print()
 
 
-asyncio.run(main())
+if sys.platform != "win32":
+    uvloop.run(main())
+else:
+    asyncio.run(main())
@@ -1,8 +1,12 @@
 import asyncio
 import random
+import sys
 
 from sider import RedisPool
 
+if sys.platform != "win32":
+    import uvloop
+
 
 async def main() -> None:
     pool = RedisPool(size=2)
@@ -14,10 +18,15 @@ async def main() -> None:
             await asyncio.sleep(random.random())
         print(f"pool consumer {n+1} complete")
 
-    await asyncio.gather(*[pool_consumer(n) for n in range(8)])
+    async with asyncio.TaskGroup() as tg:
+        for n in range(8):
+            tg.create_task(pool_consumer(n))
 
     await pool.drain()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if sys.platform != "win32":
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
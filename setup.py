@@ -5,6 +5,15 @@ __version__ = "1.0.0"
 PACKAGES = ["sider"]
 REQUIRES = ["hiredis", "uvloop"]
 
+try:
+    from Cython.Build import cythonize
+
+    EXT_MODULES = cythonize(["sider/_resp.pyx"], language_level="3")
+except ImportError:
+    # the compiled RESP encoder is optional; the pure-python
+    # implementation in sider.utils is used instead
+    EXT_MODULES = []
+
 setup(
     name="sider",
     version=__version__,
@@ -15,4 +24,5 @@ setup(
     provides=PACKAGES,
     install_requires=REQUIRES,
     requires=REQUIRES,
+    ext_modules=EXT_MODULES,
 )
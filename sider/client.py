@@ -1,13 +1,14 @@
 import asyncio
-import itertools
 import logging
 import secrets
+import socket
 import time
 from contextlib import asynccontextmanager
 from typing import (
     Any,
     AsyncGenerator,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -18,17 +19,30 @@ from typing import (
 import hiredis
 
 from .exceptions import ClientError, ProtocolError, RedisError, ReplyError
-from .utils import construct_command
+from .utils import command_prefix, construct_command, construct_command_str, construct_fixed
 
 logger = logging.getLogger(__name__)
 
+_SET_PREFIX = command_prefix(b"SET", 3)
+_SET_EX_PREFIX = command_prefix(b"SET", 5)
+_GET_PREFIX = command_prefix(b"GET", 2)
+_SELECT_PREFIX = command_prefix(b"SELECT", 2)
+_PING_FRAME = construct_command(b"PING")
+_MULTI_FRAME = construct_command(b"MULTI")
+_EXEC_FRAME = construct_command(b"EXEC")
+
+# how much to pull off the socket per read when draining replies; reads
+# borrow from the stream's internal buffer, so this caps the size of the
+# transient chunk handed to hiredis rather than preallocating anything
+_READ_CHUNK = 65536
+
 
 class Pipeline:
-    __slots__ = ("_client", "_buffer")
+    __slots__ = ("_client", "_frames")
 
     def __init__(self, client: "RedisClient"):
         self._client = client
-        self._buffer = bytearray()
+        self._frames: List[bytes] = []
 
     def __enter__(self) -> "Pipeline":
         return self
@@ -36,25 +50,50 @@ class Pipeline:
     def __exit__(self, *exc: Any) -> None:
         self.clear()
 
+    @property
+    def _buffer(self) -> bytes:
+        return b"".join(self._frames)
+
     def command(self, *args: str) -> None:
-        self._buffer += construct_command(*[arg.encode() for arg in args])
+        self._frames.append(construct_command_str(*args))
 
     def bytes_command(self, *args: bytes) -> None:
-        self._buffer += construct_command(*args)
+        self._frames.append(construct_command(*args))
+
+    def set(self, key: str, val: str) -> None:
+        # common fixed-shape commands reuse a cached RESP prefix instead
+        # of re-framing the command name every call
+        self._frames.append(construct_fixed(_SET_PREFIX, key.encode(), val.encode()))
+
+    def get(self, key: str) -> None:
+        self._frames.append(construct_fixed(_GET_PREFIX, key.encode()))
+
+    def commands(self, commands: Iterable[Tuple[str, ...]]) -> None:
+        # queue a batch of commands in a single pass, without the
+        # per-command method dispatch of command()
+        self._frames += [construct_command_str(*args) for args in commands]
+
+    def bytes_commands(self, commands: Iterable[Tuple[bytes, ...]]) -> None:
+        self._frames += [construct_command(*args) for args in commands]
 
     def clear(self) -> None:
-        self._buffer = bytearray()
+        self._frames = []
 
     async def execute(self, transaction: bool = False, ignore_results: bool = False) -> Any:
-        buffer = self._buffer
-        self.clear()
-        return await self._client._buffer_execute(buffer, transaction=transaction, ignore_results=ignore_results)  # pylint: disable=protected-access
+        # hand the frames over as-is; they are never joined, the
+        # transport submits them as one writev-style batch
+        frames = self._frames
+        self._frames = []
+        return await self._client._buffer_execute(  # pylint: disable=protected-access
+            frames, len(frames), transaction=transaction, ignore_results=ignore_results
+        )
 
 
 class RedisClient:
     __slots__ = (
         "_reader",
         "_writer",
+        "_transport",
         "_multi",
         "_parser",
         "_db",
@@ -64,30 +103,51 @@ class RedisClient:
         "_name",
         "_last_sent",
         "_encoding",
+        "_tcp_nodelay",
+        "_socket_buffer",
+        "_token_counter",
+        "_token_prefix",
+        "_pending_frames",
+        "_flush_scheduled",
     )
 
     def __init__(
         self,
         host: str = "127.0.0.1",
         port: int = 6379,
-        password: Optional[str] = None,
+        password: Optional[Union[str, bytes]] = None,
         database: int = 0,
-        name: Optional[str] = None,
+        name: Optional[Union[str, bytes]] = None,
         encoding: Optional[str] = "utf-8",
+        tcp_nodelay: bool = True,
+        socket_buffer: Optional[int] = None,
     ):
         self._host = host
         self._port = port
-        self._password = password
+        # credentials are encoded up front (and accepted pre-encoded),
+        # so reconnect-heavy callers like the pool never re-encode them
+        self._password = password.encode() if isinstance(password, str) else password
         self._db = database
-        self._name = name
+        self._name = name.encode() if isinstance(name, str) else name
+        self._tcp_nodelay = tcp_nodelay
+        self._socket_buffer = socket_buffer
 
         # io
         self._reader: Optional[asyncio.StreamReader] = None
         self._writer: Optional[asyncio.StreamWriter] = None
+        self._transport: Optional[asyncio.WriteTransport] = None
 
         # modes
         self._multi = False
         self._last_sent: Optional[Tuple[bytes, ...]] = None
+        self._token_counter = 0
+        # drawn once per client, so sentinel tokens stay unpredictable
+        # without touching the crypto RNG on the hot path
+        self._token_prefix = b"sider-" + secrets.token_hex(8).encode()
+
+        # frames queued for the next flush tick; see _do_flush
+        self._pending_frames: List[bytes] = []
+        self._flush_scheduled = False
 
         self._encoding = encoding
 
@@ -110,25 +170,42 @@ class RedisClient:
             self._port,
             limit=1024 * 1024 * 1024,
         )
+        # write to the transport directly, skipping the StreamWriter
+        # bookkeeping layer on every command
+        self._transport = self._writer.transport
+        sock = self._writer.get_extra_info("socket")
+        if sock is not None:
+            if self._tcp_nodelay:
+                # don't let nagle delay small command writes
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self._socket_buffer:
+                # larger kernel buffers let big pipelines move in fewer
+                # syscalls
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self._socket_buffer)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self._socket_buffer)
         if self._db != 0:
             await self.select(self._db)
         if self._password:
             password = self._password
             self._password = None
-            await self.command("AUTH", password)
+            await self.bytes_command(b"AUTH", password)
         if self._name:
-            await self.command("CLIENT", "SETNAME", self._name)
+            await self.bytes_command(b"CLIENT", b"SETNAME", self._name)
         return self
 
     def _send_command(self, *args: bytes) -> None:
-        assert self._writer
+        assert self._transport
         self._last_sent = args
-        self._writer.write(construct_command(*args))
+        self._transport.write(construct_command(*args))
 
     async def _read(self) -> Union[str, int, List[Union[str, int]]]:
         assert self._reader
         while (response := self._parser.gets()) is False:
-            data = await self._reader.readuntil(b"\r\n")
+            # feed the parser whatever has arrived instead of scanning
+            # for each line; hiredis does its own framing
+            data = await self._reader.read(_READ_CHUNK)
+            if not data:
+                raise ClientError("Connection closed while reading response.")
             self._parser.feed(data)
         if isinstance(response, RedisError):
             raise response
@@ -137,44 +214,83 @@ class RedisClient:
 
     async def _buffer_execute(
         self,
-        command_buffer: bytes,
+        frames: List[bytes],
+        expected: int,
         transaction: bool = False,
         ignore_results: bool = False,
     ) -> Any:
-        assert self._writer and self._reader
+        assert self._transport and self._reader
         if self._multi:
             raise ClientError("Cannot execute buffer during transaction.")
-        if not command_buffer:
+        if not frames:
             raise ClientError("Attempted to execute empty buffer.")
-        token = secrets.token_hex(8).encode()
 
         if transaction:
-            self._send_command(b"MULTI")
-        self._writer.write(command_buffer)
-        if transaction:
-            self._send_command(b"EXEC")
-        self._send_command(b"ECHO", token)
+            frames.insert(0, _MULTI_FRAME)
+            frames.append(_EXEC_FRAME)
 
         if ignore_results:
             # for the speed freaks:
-            # we don't care about any of the responses, just read from
-            # the server until we hit our token and discard it.
-            await self._reader.readuntil(b"%s\r\n" % token)
-            return None
+            # we don't care about any of the responses, so the parser is
+            # bypassed entirely and no reply is ever turned into a
+            # Python object. a trailing ECHO sentinel is appended and
+            # the raw byte stream is scanned (one C-level readuntil) for
+            # its framed reply, discarding everything up to it. the
+            # random per-connection prefix keeps the token out of reach
+            # of attacker-influenced reply data, and the counter makes
+            # it unique per batch without re-hitting the crypto RNG.
+            self._token_counter += 1
+            token = b"%s-%016x" % (self._token_prefix, self._token_counter)
+            self._last_sent = (b"ECHO", token)
+            frames.append(construct_command(b"ECHO", token))
+
+        # queue the frames and flush once per event-loop tick; batches
+        # from several pipelines land in a single writelines call, and
+        # the await below yields to the loop so the flush always runs
+        # before any reply is expected
+        self._pending_frames += frames
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._do_flush)
 
-        parser = self._parser
-
-        parser.feed(await self._reader.readuntil(b"%s\r\n" % token))
-        results = []
+        if ignore_results:
+            await self._reader.readuntil(b"$%d\r\n%s\r\n" % (len(token), token))
+            return None
 
-        check_token = token.decode() if self._encoding else token
+        # every buffered command produces exactly one reply, so drain by
+        # count instead of scanning for a sentinel (plus the MULTI "OK"
+        # and the EXEC reply when running transactionally)
+        if transaction:
+            expected += 2
 
-        while (response := parser.gets()) != check_token:
-            if not transaction or isinstance(response, list):
-                results.append(response)
+        parser = self._parser
+        reader = self._reader
+        # the reply count is known up front, so size the list once
+        # instead of growing it per append
+        results: List[Any] = [None] * expected
+        for i in range(expected):
+            while (response := parser.gets()) is False:
+                data = await reader.read(_READ_CHUNK)
+                if not data:
+                    raise ClientError("Connection closed while reading response.")
+                parser.feed(data)
+            results[i] = response
         if transaction:
-            assert len(results) == 1
-        return results[0] if transaction else results
+            exec_result = results[-1]
+            assert isinstance(exec_result, list)
+            return exec_result
+        return results
+
+    def _do_flush(self) -> None:
+        # submit everything queued this tick in one go; uvloop turns
+        # writelines into a single writev-style syscall instead of one
+        # write per frame
+        self._flush_scheduled = False
+        frames = self._pending_frames
+        if frames:
+            self._pending_frames = []
+            assert self._transport
+            self._transport.writelines(frames)
 
     async def close(self) -> None:
         assert self._writer
@@ -208,22 +324,43 @@ class RedisClient:
     def pipeline(self) -> Pipeline:
         return Pipeline(self)
 
+    async def pipeline_execute(
+        self,
+        commands: Iterable[Tuple[Union[str, bytes], ...]],
+        transaction: bool = False,
+        ignore_results: bool = False,
+    ) -> Any:
+        # one-shot pipeline: encode the whole batch in a single pass and
+        # execute it without going through a Pipeline object
+        frames = [construct_command(*[a.encode() if isinstance(a, str) else a for a in args]) for args in commands]
+        return await self._buffer_execute(
+            frames,
+            len(frames),
+            transaction=transaction,
+            ignore_results=ignore_results,
+        )
+
     async def set(
         self,
         key: str,
         val: str,
         expire: Optional[int] = None,
     ) -> None:
+        # fixed-arity commands write a cached prefix plus their args,
+        # skipping the varargs packing in _send_command
+        assert self._transport
         if expire:
-            self._send_command(
-                b"SET",
-                key.encode(),
-                val.encode(),
-                b"EX",
-                str(expire).encode(),
+            self._transport.write(
+                construct_fixed(
+                    _SET_EX_PREFIX,
+                    key.encode(),
+                    val.encode(),
+                    b"EX",
+                    str(expire).encode(),
+                )
             )
         else:
-            self._send_command(b"SET", key.encode(), val.encode())
+            self._transport.write(construct_fixed(_SET_PREFIX, key.encode(), val.encode()))
         response = await self._read()
         if self._multi:
             assert response == "QUEUED"
@@ -231,12 +368,14 @@ class RedisClient:
             assert response == "OK"
 
     async def select(self, database: int) -> None:
-        self._send_command(b"SELECT", str(database).encode())
+        assert self._transport
+        self._transport.write(construct_fixed(_SELECT_PREFIX, str(database).encode()))
         assert await self._read() == "OK"
         self._db = database
 
     async def command(self, *args: str) -> Any:
-        self._send_command(*[a.encode() for a in args])
+        assert self._transport
+        self._transport.write(construct_command_str(*args))
         return await self._read()
 
     async def bytes_command(self, *args: bytes) -> Any:
@@ -244,7 +383,10 @@ class RedisClient:
         return await self._read()
 
     async def get(self, key: str) -> str:
-        return await self.command("GET", key)
+        assert self._transport
+        self._transport.write(construct_fixed(_GET_PREFIX, key.encode()))
+        response: Any = await self._read()
+        return response
 
     async def multi(self) -> None:
         assert not self._multi
@@ -288,11 +430,15 @@ class RedisClient:
     # connection
 
     async def ping(self, latency: bool = False) -> Union[str, int]:
+        assert self._transport
         if latency:
             start = time.perf_counter()
-            assert await self.bytes_command(b"PING") == "PONG"
+            self._transport.write(_PING_FRAME)
+            assert await self._read() == "PONG"
             return int((time.perf_counter() - start) * 1000)
-        return await self.bytes_command(b"PING")
+        self._transport.write(_PING_FRAME)
+        response: Any = await self._read()
+        return response
 
     # strings
 
@@ -319,11 +465,13 @@ class RedisClient:
             raise ClientError("Cannot set empty dict")
         if overwrite:
             await self.command("DEL", key)
-        return await self.command(
-            "HSET",
-            key,
-            *itertools.chain.from_iterable(set_dict.items()),
-        )
+        # flatten the dict into pre-encoded args in one pass, skipping
+        # the re-encoding done by the str command path
+        args = [b"HSET", key.encode()]
+        for k, v in set_dict.items():
+            args.append(k.encode() if isinstance(k, str) else k)
+            args.append(v.encode() if isinstance(v, str) else v)
+        return await self.bytes_command(*args)
 
     async def hget(self, key: str, field: str) -> str:
         return await self.command("HGET", key, field)
@@ -342,4 +490,7 @@ class RedisClient:
 
     async def hgetall(self, key: str) -> Dict[Any, Any]:
         r = await self.command("HGETALL", key)
-        return dict(itertools.zip_longest(*[iter(r)] * 2, fillvalue=""))
+        # pair up the flat field/value reply; zip consumes the single
+        # iterator twice without any sentinel checks
+        it = iter(r)
+        return dict(zip(it, it))
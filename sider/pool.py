@@ -1,7 +1,8 @@
 import asyncio
 import logging
+from collections import deque
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Deque, Optional
 
 from .client import RedisClient
 
@@ -14,10 +15,13 @@ class RedisPool:
         "port",
         "name",
         "_size",
+        "_name",
         "_password",
         "_held",
-        "_lock",
-        "_pool",
+        "_available",
+        "_sem",
+        "_idle",
+        "_waiters",
     )
 
     def __init__(
@@ -31,19 +35,33 @@ class RedisPool:
         self.host = host
         self.port = port
         self.name = name
-        self._password = password
+        # encode once here; every reconnect hands the client the same
+        # bytes instead of re-encoding per dial
+        self._name = name.encode() if name else None
+        self._password = password.encode() if password else None
         self._held = 0
+        self._available = 0
         self._size = size
-        self._lock = asyncio.Lock()
-        self._pool: "asyncio.Queue[RedisClient]" = asyncio.Queue(maxsize=size)
+        # encodes "at most size checked-out connections"; its FIFO
+        # waiter queue keeps late getters from being starved by bursts
+        self._sem = asyncio.BoundedSemaphore(size)
+        # idle connections, popped LIFO so the most recently used
+        # socket (with the warmest buffers) goes out first
+        self._idle: Deque[RedisClient] = deque()
+        # drain() parks here until put() hands a connection back
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
 
     async def init(self) -> "RedisPool":
-        for _ in range(self._size - self.held - self.available):
-            await self._pool.put(await self._get_client())
+        # connect the missing clients concurrently; warmup takes one
+        # round-trip instead of one per connection
+        missing = self._size - self.held - self.available
+        for conn in await asyncio.gather(*[self._get_client() for _ in range(missing)]):
+            self._idle.append(conn)
+            self._available += 1
         return self
 
     async def _get_client(self) -> RedisClient:
-        c = await RedisClient(self.host, self.port, self._password, name=self.name).connect()
+        c = await RedisClient(self.host, self.port, self._password, name=self._name).connect()
         return c
 
     async def _ensure_open(self, conn: RedisClient) -> RedisClient:
@@ -53,18 +71,36 @@ class RedisPool:
         return conn
 
     async def get(self) -> RedisClient:
-        async with self._lock:
-            if self._pool.empty() and self._held < self._size:
-                conn = await self._get_client()
-            else:
-                conn = await self._ensure_open(await self._pool.get())
-            self._held += 1
-        return conn
+        # uncontended acquire doesn't suspend, so the common case is
+        # still a straight pop off the idle deque
+        await self._sem.acquire()
+        self._held += 1
+        try:
+            if self._idle:
+                conn = self._idle.pop()
+                self._available -= 1
+                if not conn.is_closed:
+                    return conn
+                return await self._ensure_open(conn)
+            return await self._get_client()
+        except BaseException:
+            self._held -= 1
+            self._sem.release()
+            raise
 
     async def put(self, conn: RedisClient) -> None:
-        assert not self._pool.full()
-        await self._pool.put(await self._ensure_open(conn))
+        assert len(self._idle) < self._size
+        if conn.is_closed:
+            conn = await self._ensure_open(conn)
+        self._idle.append(conn)
+        self._available += 1
         self._held -= 1
+        self._sem.release()
+        while self._waiters:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                fut.set_result(None)
+                break
 
     @asynccontextmanager
     async def acquire(self) -> AsyncGenerator[RedisClient, None]:
@@ -75,9 +111,26 @@ class RedisPool:
             await self.put(conn)
 
     async def drain(self, wait: bool = True) -> None:
-        while not self._pool.empty() or (wait and self._held > 0):
-            client = await self._pool.get()
-            await client.close()
+        # close each idle batch concurrently, so shutdown costs one
+        # close handshake instead of one per connection
+        while True:
+            closing = list(self._idle)
+            self._idle.clear()
+            self._available = 0
+            if closing:
+                await asyncio.gather(*(client.close() for client in closing))
+            if self._idle:
+                # a holder called put() while the batch above was
+                # closing; go straight back around and sweep the late
+                # returns instead of leaving them open
+                continue
+            if not (wait and self._held > 0):
+                return
+            # held connections come back through put(), which wakes the
+            # waiter; loop around to close the returned batch
+            fut: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+            self._waiters.append(fut)
+            await fut
 
     @property
     def held(self) -> int:
@@ -85,8 +138,12 @@ class RedisPool:
 
     @property
     def available(self) -> int:
-        return self._pool.qsize()
+        # kept as a plain counter so sampling this is an attribute
+        # load, not a len() through the deque
+        return self._available
 
     @property
     def locked(self) -> bool:
-        return self._lock.locked()
+        # true when every connection is checked out and the next get()
+        # would have to wait
+        return self._sem.locked()
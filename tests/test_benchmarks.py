@@ -1,5 +1,33 @@
+from io import BytesIO
+
 from sider.utils import construct_command
 
+FRAMES = [construct_command(b"SET", b"%d" % n, b"%d" % n) for n in range(1000)]
+
+
+def assemble_list(frames):
+    parts = []
+    append = parts.append
+    for frame in frames:
+        append(frame)
+    return b"".join(parts)
+
+
+def assemble_bytesio(frames):
+    buffer = BytesIO()
+    write = buffer.write
+    for frame in frames:
+        write(frame)
+    return buffer.getvalue()
+
 
 def test_bench_construct(benchmark):
     benchmark(construct_command, b"A", b"B", b"C")
+
+
+def test_bench_buffer_list(benchmark):
+    assert benchmark(assemble_list, FRAMES) == b"".join(FRAMES)
+
+
+def test_bench_buffer_bytesio(benchmark):
+    assert benchmark(assemble_bytesio, FRAMES) == b"".join(FRAMES)
@@ -1,14 +1,14 @@
 # mypy: disable-error-code="func-returns-value"
 
 import os
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from sider.client import ClientError, RedisClient, RedisError
 from sider.exceptions import ReplyError
 from sider.pool import RedisPool
-from sider.utils import construct_command
+from sider.utils import command_prefix, construct_command, construct_command_str, construct_fixed
 
 REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.environ.get("REDIS_PORT", 6379))
@@ -24,20 +24,39 @@ def test_construct_command():
         assert construct_command(*args) == expected
 
 
+def test_construct_command_str():
+    for args, expected in proto_tests:
+        assert construct_command_str(*[a.decode() for a in args]) == expected
+
+
+def test_construct_fixed():
+    for args, expected in proto_tests:
+        prefix = command_prefix(args[0], len(args))
+        assert construct_fixed(prefix, *args[1:]) == expected
+
+
+def test_slots():
+    # every per-connection object is slotted; a stray __dict__ would
+    # silently reintroduce the per-instance memory overhead
+    client = RedisClient()
+    for instance in (client, client.pipeline(), RedisPool()):
+        assert not hasattr(instance, "__dict__")
+
+
 def test_mocked_writer():
     client = RedisClient()
 
-    mock_writer = Mock()
-    client._writer = mock_writer
+    mock_transport = Mock()
+    client._transport = mock_transport
 
     for args, expected in proto_tests:
         client._send_command(*args)
-        mock_writer.write.assert_called_with(expected)
+        mock_transport.write.assert_called_with(expected)
 
 
 @pytest.mark.anyio
 @pytest.mark.integration
-async def test_keys_reads(redis, mocker):
+async def test_keys_reads(redis):
     pipe = redis.pipeline()
     import random
 
@@ -46,31 +65,31 @@ async def test_keys_reads(redis, mocker):
     for n in range(number):
         pipe.command("SET", f"aliases/{n}", str(n))
     await pipe.execute()
-    spy = mocker.spy(redis._reader, "readuntil")
     pipe.command("KEYS", "aliases/*")
     result = await pipe.execute()
     assert len(result[0]) == number
-    assert spy.call_count == 1
 
 
 @pytest.mark.anyio
 async def test_mocked_send_command():
-    with patch("sider.RedisClient._send_command", new_callable=Mock) as mock_send:
-        client = RedisClient()
+    client = RedisClient()
+
+    mock_transport = Mock()
+    client._transport = mock_transport
 
-        # mock the reader to emulate server
-        mock_reader = AsyncMock()
-        mock_reader.readuntil.return_value = b"$3\r\nbar\r\n"
-        client._reader = mock_reader
+    # mock the reader to emulate server
+    mock_reader = AsyncMock()
+    mock_reader.read.return_value = b"$3\r\nbar\r\n"
+    client._reader = mock_reader
 
-        result = await client.get("foo")
-        mock_send.assert_called_with(b"GET", b"foo")
-        assert result == "bar"
+    result = await client.get("foo")
+    mock_transport.write.assert_called_with(b"*2\r\n$3\r\nGET\r\n$3\r\nfoo\r\n")
+    assert result == "bar"
 
-        mock_reader.readuntil.return_value = b"$2\r\nOK\r\n"
-        result = await client.set("bar", "baz")
-        mock_send.assert_called_with(b"SET", b"bar", b"baz")
-        assert result is None
+    mock_reader.read.return_value = b"$2\r\nOK\r\n"
+    result = await client.set("bar", "baz")
+    mock_transport.write.assert_called_with(b"*3\r\n$3\r\nSET\r\n$3\r\nbar\r\n$3\r\nbaz\r\n")
+    assert result is None
 
 
 # Integration tests require a running redis instance on 127.0.0.1:6379
@@ -81,11 +100,16 @@ async def test_sider_client():
     with pytest.raises(RedisError):
         await RedisClient(host=REDIS_HOST, port=REDIS_PORT, password="no-password").connect()
 
-    client = RedisClient(host=REDIS_HOST, port=REDIS_PORT, database=1, name="sider-test")
+    client = RedisClient(host=REDIS_HOST, port=REDIS_PORT, database=1, name="sider-test", socket_buffer=1 << 20)
     await client.connect()
 
     assert await client.command("CLIENT", "GETNAME") == "sider-test"
 
+    import socket
+
+    sock = client._writer.get_extra_info("socket")
+    assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) == 1
+
 
 @pytest.mark.anyio
 async def test_sider_pool(redis_pool: RedisPool):
@@ -233,6 +257,13 @@ async def test_sider_transaction(redis: RedisClient):
     assert not redis.in_multi
 
 
+@pytest.mark.anyio
+async def test_sider_pipeline_execute(redis: RedisClient):
+    assert await redis.pipeline_execute([("SET", "foo", "bar"), (b"GET", b"foo")]) == ["OK", "bar"]
+    assert await redis.pipeline_execute([("SET", "a", "1"), ("SET", "b", "2")], ignore_results=True) is None
+    assert await redis.pipeline_execute([("GET", "a"), ("GET", "b")], transaction=True) == ["1", "2"]
+
+
 @pytest.mark.anyio
 async def test_sider_connection(redis: RedisClient):
     assert await redis.ping() == "PONG"
@@ -299,6 +330,16 @@ async def test_sider_pipeline(redis: RedisClient):
     pipe.bytes_command(b"GET", b"bar")
     assert await pipe.execute() == ["bar", "baz"]
 
+    # batched submission
+    pipe.commands([("SET", "batch-1", "a"), ("SET", "batch-2", "b")])
+    pipe.bytes_commands([(b"GET", b"batch-1"), (b"GET", b"batch-2")])
+    assert await pipe.execute() == ["OK", "OK", "a", "b"]
+
+    # fixed-shape helpers
+    pipe.set("fixed", "value")
+    pipe.get("fixed")
+    assert await pipe.execute() == ["OK", "value"]
+
     # test pipeline with statement
     with redis.pipeline() as pipe:
         pipe.command("GET", "foo")
@@ -15,3 +15,9 @@ def test_sider_utils(capsys):
     captured = capsys.readouterr()
     assert "µs/it" not in captured.out
     assert "bar-baz" in captured.out
+
+    with time_it(None, iterations=100):
+        pass
+
+    captured = capsys.readouterr()
+    assert captured.out == ""